@@ -16,7 +16,8 @@ from pants.util.contextutil import open_zip
 
 
 class DependencyContext(object):
-  alias_types = (Target, AliasTarget)
+  # NB: Only ever tested via exact `type(target) in alias_types` membership, once per edge walked.
+  alias_types = frozenset((Target, AliasTarget))
   # TODO: See comment on pants.build_graph.target._get_synthetic_target.
   codegen_types = (JavaProtobufLibrary, JavaThriftLibrary)
 
@@ -28,6 +29,22 @@ class DependencyContext(object):
     """
     self.compiler_plugin_types = compiler_plugin_types
     self.target_closure_kwargs = target_closure_kwargs
+    self._closures = {}
+
+  def all_dependencies(self, target):
+    """Returns the transitive closure of the given target under this context's closure kwargs.
+
+    Closures are memoized, so targets sharing a dependency (eg: a compiler plugin) only walk its
+    closure once.
+
+    :rtype: tuple of :class:`pants.build_graph.target.Target`
+    """
+    # NB: A closure always contains its root, so keyed targets are retained and ids not recycled.
+    closure = self._closures.get(id(target))
+    if closure is None:
+      closure = tuple(target.closure(bfs=True, **self.target_closure_kwargs))
+      self._closures[id(target)] = closure
+    return closure
 
 
 class CompileContext(object):
@@ -53,6 +53,7 @@ class ResolvedJarAwareFingerprintStrategy(FingerprintStrategy):
     super(ResolvedJarAwareFingerprintStrategy, self).__init__()
     self._classpath_products = classpath_products
     self._dep_context = dep_context
+    self._hash = hash(type(self))
 
   def compute_fingerprint(self, target):
     if isinstance(target, Resources):
@@ -67,10 +68,15 @@ class ResolvedJarAwareFingerprintStrategy(FingerprintStrategy):
       # source file depends on a library with source compatible but binary incompatible signature
       # changes between versions, that you won't get runtime errors due to using an artifact built
       # against a binary incompatible version resolved for a previous compile.
+      # NB: This must not be batched across jar_libraries: excludes are applied over the closure of
+      # all the targets queried, so one library's excludes would leak into another's fingerprint.
       classpath_entries = self._classpath_products.get_artifact_classpath_entries_for_targets(
         [target])
-      for _, entry in classpath_entries:
-        hasher.update(str(entry.coordinate))
+      # NB: The coordinates are sorted so that the fingerprint does not depend on resolve order, and
+      # then hashed with a single update to avoid paying the per-call hasher overhead. The newline
+      # separator cannot appear in a coordinate, so fields cannot run together across coordinates.
+      coordinates = sorted(entry.coordinate.canonical_bytes for _, entry in classpath_entries)
+      hasher.update(b'\n'.join(coordinates))
     return hasher.hexdigest()
 
   def direct(self, target):
@@ -84,10 +90,10 @@ class ResolvedJarAwareFingerprintStrategy(FingerprintStrategy):
     return super(ResolvedJarAwareFingerprintStrategy, self).dependencies(target)
 
   def __hash__(self):
-    return hash(type(self))
+    return self._hash
 
   def __eq__(self, other):
-    return type(self) == type(other)
+    return self is other or type(self) is type(other)
 
 
 class JvmCompile(NailgunTaskBase):
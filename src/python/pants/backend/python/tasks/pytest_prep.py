@@ -12,6 +12,7 @@ from pex.pex_info import PexInfo
 
 from pants.backend.python.subsystems.pytest import PyTest
 from pants.backend.python.tasks.python_execution_task_base import PythonExecutionTaskBase
+from pants.util.memo import memoized
 
 
 class PytestPrep(PythonExecutionTaskBase):
@@ -20,8 +21,11 @@ class PytestPrep(PythonExecutionTaskBase):
   class PytestBinary(object):
     """A `py.test` PEX binary with an embedded default (empty) `pytest.ini` config file."""
 
+    __slots__ = ('_pex', '_config_path')
+
     def __init__(self, pex):
       self._pex = pex
+      self._config_path = os.path.join(pex.path(), 'pytest.ini')
 
     @property
     def pex(self):
@@ -37,7 +41,7 @@ class PytestPrep(PythonExecutionTaskBase):
 
       :rtype: str
       """
-      return os.path.join(self._pex.path(), 'pytest.ini')
+      return self._config_path
 
   @classmethod
   def implementation_version(cls):
@@ -54,14 +58,19 @@ class PytestPrep(PythonExecutionTaskBase):
   def extra_requirements(self):
     return PyTest.global_instance().get_requirement_strings()
 
-  def extra_files(self):
-    yield self.ExtraFile.empty('pytest.ini')
-
+  @classmethod
+  @memoized
+  def _coverage_plugin(cls):
+    # NB: The plugin is embedded at the same package-relative path it has in pants itself.
     enclosing_dir = os.path.dirname(__name__.replace('.', os.sep))
     plugin_path = os.path.join(enclosing_dir, 'coverage/plugin.py')
-    yield self.ExtraFile(path=plugin_path,
+    return cls.ExtraFile(path=plugin_path,
                          content=pkg_resources.resource_string(__name__, 'coverage/plugin.py'))
 
+  def extra_files(self):
+    yield self.ExtraFile.empty('pytest.ini')
+    yield self._coverage_plugin()
+
   def execute(self):
     pex_info = PexInfo.default()
     pex_info.entry_point = 'pytest'
@@ -528,24 +528,33 @@ class BuildGraph(AbstractClass):
     """
     walk = self._walk_factory(dep_predicate, leveled_predicate)
 
+    # NB: The loop below runs once per edge in the closure, so bind its lookups to locals up front.
+    expand_once = walk.expand_once
+    do_work_once = walk.do_work_once
+    expanded_or_worked = walk.expanded_or_worked
+    walk_dep_predicate = walk.dep_predicate
+    target_by_address = self._target_by_address
+    target_dependencies_by_address = self._target_dependencies_by_address
+
     ordered_closure = OrderedSet()
     to_walk = deque((0, addr) for addr in addresses)
-    while len(to_walk) > 0:
-      level, address = to_walk.popleft()
+    pop, append = to_walk.popleft, to_walk.append
+    while to_walk:
+      level, address = pop()
 
-      if not walk.expand_once(address, level):
+      if not expand_once(address, level):
         continue
 
-      target = self._target_by_address[address]
+      target = target_by_address[address]
       if predicate and not predicate(target):
         continue
-      if walk.do_work_once(address):
+      if do_work_once(address):
         ordered_closure.add(target)
-      for dep_address in self._target_dependencies_by_address[address]:
-        if walk.expanded_or_worked(dep_address):
+      for dep_address in target_dependencies_by_address[address]:
+        if expanded_or_worked(dep_address):
           continue
-        if walk.dep_predicate(target, self._target_by_address[dep_address], level):
-          to_walk.append((level + 1, dep_address))
+        if walk_dep_predicate(target, target_by_address[dep_address], level):
+          append((level + 1, dep_address))
     return ordered_closure
 
   @abstractmethod
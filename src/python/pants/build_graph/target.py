@@ -336,6 +336,7 @@ class Target(AbstractTarget):
     self._cached_direct_transitive_fingerprint_map = {}
     self._cached_strict_dependencies_map = {}
     self._cached_exports_addresses = None
+    self._cached_exports_address_set = None
     self._no_cache = no_cache
     if kwargs:
       self.Arguments.check(self, kwargs)
@@ -420,6 +421,7 @@ class Target(AbstractTarget):
     self._cached_direct_transitive_fingerprint_map = {}
     self._cached_strict_dependencies_map = {}
     self._cached_exports_addresses = None
+    self._cached_exports_address_set = None
     self.mark_extra_invalidation_hash_dirty()
     self.payload.mark_dirty()
 
@@ -661,12 +663,15 @@ class Target(AbstractTarget):
           exports.append(Address.parse(export_spec, relative_to=self.address.spec_path))
       exports = tuple(exports)
 
-      dep_addresses = {d.address for d in self.dependencies}
-      invalid_export_specs = [a.spec for a in exports if a not in dep_addresses]
-      if len(invalid_export_specs) > 0:
-        raise TargetDefinitionException(
-            self,
-            'Invalid exports: these exports must also be dependencies\n  {}'.format('\n  '.join(invalid_export_specs)))
+      # NB: Most targets export nothing, so only pay for validation against our dependencies when
+      # there is something to validate.
+      if exports:
+        dep_addresses = set(self._build_graph.dependencies_of(self.address))
+        invalid_export_specs = [a.spec for a in exports if a not in dep_addresses]
+        if len(invalid_export_specs) > 0:
+          raise TargetDefinitionException(
+              self,
+              'Invalid exports: these exports must also be dependencies\n  {}'.format('\n  '.join(invalid_export_specs)))
 
       self._cached_exports_addresses = exports
     return exports
@@ -683,15 +688,17 @@ class Target(AbstractTarget):
     """
     strict_deps = self._cached_strict_dependencies_map.get(dep_context, None)
     if strict_deps is None:
-      default_predicate = self._closure_dep_predicate({self},
-                                                      **dep_context.target_closure_kwargs)
+      # NB: These are consulted once per edge walked below, so resolve them up front.
+      alias_types = dep_context.alias_types
+      compiler_plugin_types = dep_context.compiler_plugin_types
+      default_predicate = self._closure_dep_predicate({self}, **dep_context.target_closure_kwargs)
 
       def dep_predicate(source, dependency):
         if not default_predicate(source, dependency):
           return False
 
-        # Always expand aliases.
-        if type(source) in dep_context.alias_types:
+        # Always expand our own declared dependencies, and aliases.
+        if source is self or type(source) in alias_types:
           return True
 
         # Traverse other dependencies if they are exported.
@@ -699,31 +706,48 @@ class Target(AbstractTarget):
           return True
         return False
 
-      dep_addresses = [d.address for d in self.dependencies
-                        if default_predicate(self, d)
-                      ]
+      # NB: Walking from this target itself lets a single pass both select its declared
+      # dependencies and expand aliases and exports beneath them.
       result = self._build_graph.transitive_subgraph_of_addresses_bfs(
-        addresses=dep_addresses,
+        addresses=[self.address],
         dep_predicate=dep_predicate
       )
 
-      strict_deps = OrderedSet()
+      # NB: Compiler plugin closures frequently overlap with each other and with the declared deps,
+      # so dedupe as we go; a plain list and set are much cheaper here than an OrderedSet.
+      strict_deps = []
+      seen = set()
       for declared in result:
-        if type(declared) in dep_context.alias_types:
+        if declared is self or type(declared) in alias_types:
           continue
-        if isinstance(declared, dep_context.compiler_plugin_types):
-          strict_deps.update(declared.closure(
-            bfs=True,
-            **dep_context.target_closure_kwargs))
-        strict_deps.add(declared)
+        if isinstance(declared, compiler_plugin_types):
+          deps = dep_context.all_dependencies(declared)
+        else:
+          deps = (declared,)
+        for dep in deps:
+          # NB: Keyed by id to skip Target.__hash__/__eq__; `strict_deps` retains every dep.
+          dep_id = id(dep)
+          if dep_id not in seen:
+            seen.add(dep_id)
+            strict_deps.append(dep)
 
-      strict_deps = list(strict_deps)
       self._cached_strict_dependencies_map[dep_context] = strict_deps
     return strict_deps
 
+  @property
+  def _export_address_set(self):
+    export_address_set = self._cached_exports_address_set
+    if export_address_set is None:
+      export_address_set = frozenset(self.export_addresses)
+      self._cached_exports_address_set = export_address_set
+    return export_address_set
+
   def _dep_is_exported(self, dependency):
-    return dependency.address in self.export_addresses or \
-           dependency.is_synthetic and (dependency.concrete_derived_from.address in self.export_addresses)
+    exports = self._export_address_set
+    if not exports:
+      return False
+    return dependency.address in exports or \
+           dependency.is_synthetic and (dependency.concrete_derived_from.address in exports)
 
   @property
   def dependents(self):
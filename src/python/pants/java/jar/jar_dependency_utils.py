@@ -121,6 +121,16 @@ class M2Coordinate(object):
     """
     return '{}:{}:{}'.format(self.org, self.name, self.rev)
 
+  @memoized_property
+  def canonical_bytes(self):
+    """Returns the utf-8 encoded form of this coordinate's unambiguous string representation.
+
+    Suitable for feeding directly to a hasher.
+
+    :rtype: bytes
+    """
+    return self._canonical_string().encode('utf-8')
+
   def __eq__(self, other):
     return isinstance(other, M2Coordinate) and self._id == other._id
 
@@ -130,7 +140,7 @@ class M2Coordinate(object):
   def __hash__(self):
     return hash(self._id)
 
-  def __str__(self):
+  def _canonical_string(self):
     # Doesn't follow https://maven.apache.org/pom.html#Maven_Coordinates
     # Instead produces an unambiguous string representation of the coordinate
     # org:name:rev:classifier:type_
@@ -138,6 +148,9 @@ class M2Coordinate(object):
     # for example org=a, name=b, type_=jar -> a:b:::jar
     return ':'.join((x or '') for x in self._id)
 
+  def __str__(self):
+    return self._canonical_string()
+
   def __repr__(self):
     return ('M2Coordinate(org={!r}, name={!r}, rev={!r}, classifier={!r}, ext={!r})'
             .format(*self._id))
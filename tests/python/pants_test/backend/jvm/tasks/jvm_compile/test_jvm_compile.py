@@ -6,10 +6,21 @@ from __future__ import (absolute_import, division, generators, nested_scopes, pr
                         unicode_literals, with_statement)
 
 import os
+import unittest
 
+import mock
+
+from pants.backend.jvm.targets.jar_library import JarLibrary
 from pants.backend.jvm.targets.java_library import JavaLibrary
 from pants.backend.jvm.tasks.classpath_products import ClasspathProducts
-from pants.backend.jvm.tasks.jvm_compile.jvm_compile import JvmCompile
+from pants.backend.jvm.tasks.jvm_compile.compile_context import DependencyContext
+from pants.backend.jvm.tasks.jvm_compile.jvm_compile import (JvmCompile,
+                                                            ResolvedJarAwareFingerprintStrategy)
+from pants.build_graph.resources import Resources
+from pants.build_graph.target_scopes import Scopes
+from pants.java.jar.jar_dependency import JarDependency
+from pants.java.jar.jar_dependency_utils import M2Coordinate
+from pants_test.base_test import BaseTest
 from pants_test.tasks.task_test_base import TaskTestBase
 
 
@@ -47,3 +58,54 @@ class JvmCompileTest(TaskTestBase):
     resulting_classpath = task.create_runtime_classpath()
     self.assertEqual([('default', pre_init_runtime_entry), ('default', compile_entry)],
       resulting_classpath.get_for_target(target))
+
+
+class DependencyContextTest(unittest.TestCase):
+
+  def test_all_dependencies_memoized(self):
+    dep_context = DependencyContext((), dict(include_scopes=Scopes.JVM_COMPILE_SCOPES,
+                                             respect_intransitive=True))
+    target = mock.Mock()
+    target.closure.return_value = [target]
+
+    self.assertEqual((target,), dep_context.all_dependencies(target))
+    self.assertEqual((target,), dep_context.all_dependencies(target))
+    target.closure.assert_called_once_with(bfs=True, **dep_context.target_closure_kwargs)
+
+
+class ResolvedJarAwareFingerprintStrategyTest(BaseTest):
+
+  def _target(self, target_type, target_id):
+    target = mock.Mock(spec=target_type, id=target_id, payload=mock.Mock())
+    target.payload.fingerprint.return_value = 'payload-{}'.format(target_id)
+    return target
+
+  def test_resources_are_not_fingerprinted(self):
+    strategy = ResolvedJarAwareFingerprintStrategy(mock.Mock(), dep_context=None)
+    self.assertIsNone(strategy.compute_fingerprint(self._target(Resources, 'resources')))
+
+  def test_fingerprint_memoized_per_target(self):
+    classpath_products = mock.Mock()
+    classpath_products.get_artifact_classpath_entries_for_targets.return_value = []
+
+    def strategy():
+      return ResolvedJarAwareFingerprintStrategy(classpath_products, dep_context=None)
+
+    jar_library = self.make_target('3rdparty:lib', JarLibrary,
+                                   jars=[JarDependency('org.example', 'lib', '1.0')])
+    fingerprint = jar_library.invalidation_hash(strategy())
+    # NB: Strategies are equal by type, so the target's memoized fingerprint serves new instances.
+    self.assertEqual(fingerprint, jar_library.invalidation_hash(strategy()))
+    self.assertEqual(1, classpath_products.get_artifact_classpath_entries_for_targets.call_count)
+
+  def test_fingerprint_independent_of_classpath_order(self):
+    entries = [('default', mock.Mock(coordinate=M2Coordinate('org.example', name, '1.0')))
+               for name in ('a', 'b', 'c')]
+
+    def fingerprint(classpath_entries):
+      classpath_products = mock.Mock()
+      classpath_products.get_artifact_classpath_entries_for_targets.return_value = classpath_entries
+      strategy = ResolvedJarAwareFingerprintStrategy(classpath_products, dep_context=None)
+      return strategy.compute_fingerprint(self._target(JarLibrary, 'jar_library'))
+
+    self.assertEqual(fingerprint(entries), fingerprint(list(reversed(entries))))
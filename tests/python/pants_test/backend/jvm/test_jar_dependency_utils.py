@@ -40,6 +40,12 @@ class JarDependencyUtilsTest(unittest.TestCase):
     self.assertEquals('org.example:lib::classify:jar', str(org_name_type_jar_classifier))
     self.assertEquals(org_name_type_jar_classifier, M2Coordinate.from_string(str(org_name_type_jar_classifier)))
 
+  def test_m2_canonical_bytes(self):
+    coordinate = M2Coordinate(org='org.example', name='lib', rev='the-ref', classifier='classify')
+
+    self.assertEquals(b'org.example:lib:the-ref:classify:jar', coordinate.canonical_bytes)
+    self.assertEquals(str(coordinate).encode('utf-8'), coordinate.canonical_bytes)
+
   def test_m2_coordinates_with_same_properties(self):
     coordinate1 = M2Coordinate('org.example', 'lib')
     coordinate2 = M2Coordinate('org.example', 'lib')
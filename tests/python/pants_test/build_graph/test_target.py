@@ -45,6 +45,10 @@ class SourcesTarget(Target):
     return self.payload.exports
 
 
+class PluginTarget(SourcesTarget):
+  pass
+
+
 class TargetTest(BaseTest):
 
   def test_derived_from_chain(self):
@@ -310,3 +314,42 @@ class TargetTest(BaseTest):
     self.assertEqual(set(self.lib_c_alias.strict_dependencies(dep_context)), {self.lib_c, self.lib_b, self.lib_a})
     self.assertEqual(set(self.lib_d.strict_dependencies(dep_context)), {self.lib_c, self.lib_b, self.lib_a})
     self.assertEqual(set(self.lib_e.strict_dependencies(dep_context)), {self.lib_d, self.lib_c, self.lib_b, self.lib_a})
+
+  def test_export_addresses(self):
+    init_subsystem(Target.Arguments)
+    dep = self.make_target('com/foo:dep', target_type=SourcesTarget, sources=[])
+    exporting = self.make_target('com/foo:exporting', target_type=SourcesTarget, sources=[],
+                                 dependencies=[dep], exports=[':dep'])
+    non_exporting = self.make_target('com/foo:non_exporting', target_type=SourcesTarget,
+                                     sources=[], dependencies=[dep])
+
+    self.assertEqual((dep.address,), exporting.export_addresses)
+    self.assertEqual((), non_exporting.export_addresses)
+
+  def test_export_addresses_must_be_dependencies(self):
+    init_subsystem(Target.Arguments)
+    dep = self.make_target('com/foo:dep', target_type=SourcesTarget, sources=[])
+    self.make_target('com/foo:other', target_type=SourcesTarget, sources=[])
+    lib = self.make_target('com/foo:lib', target_type=SourcesTarget, sources=[],
+                           dependencies=[dep], exports=[':other'])
+
+    with self.assertRaisesRegexp(TargetDefinitionException, 'Invalid exports'):
+      lib.export_addresses
+
+  def test_strict_dependencies_dedupes_compiler_plugin_closures(self):
+    init_subsystem(Target.Arguments)
+    shared = self.make_target('com/foo:shared', target_type=SourcesTarget, sources=[])
+    plugin_a = self.make_target('com/foo:plugin_a', target_type=PluginTarget, sources=[],
+                                dependencies=[shared])
+    plugin_b = self.make_target('com/foo:plugin_b', target_type=PluginTarget, sources=[],
+                                dependencies=[shared])
+    lib = self.make_target('com/foo:lib', target_type=SourcesTarget, sources=[],
+                           dependencies=[plugin_a, plugin_b])
+
+    closure_kwargs = {'include_scopes': Scopes.JVM_COMPILE_SCOPES}
+    dep_context = mock.Mock()
+    dep_context.compiler_plugin_types = (PluginTarget,)
+    dep_context.alias_types = (Target,)
+    dep_context.target_closure_kwargs = closure_kwargs
+    dep_context.all_dependencies = lambda t: tuple(t.closure(bfs=True, **closure_kwargs))
+    self.assertEqual(lib.strict_dependencies(dep_context), [plugin_a, shared, plugin_b])
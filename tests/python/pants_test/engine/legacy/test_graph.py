@@ -22,6 +22,7 @@ from pants.init.target_roots import TargetRoots
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.subsystem.subsystem import Subsystem
 from pants.util.contextutil import temporary_dir
+from pants.util.dirutil import safe_mkdtemp, safe_rmtree
 from pants_test.engine.util import init_native
 
 
@@ -41,17 +42,24 @@ class GraphTestBase(unittest.TestCase):
     options.target_specs = specs
     return options
 
+  @classmethod
+  def _setup_legacy_graph(cls, work_dir, build_file_aliases=None, build_file_imports_behavior='allow',
+                          include_trace_on_error=True):
+    path_ignore_patterns = ['.*']
+    return EngineInitializer.setup_legacy_graph(path_ignore_patterns,
+                                                work_dir,
+                                                build_file_imports_behavior,
+                                                build_file_aliases=build_file_aliases,
+                                                native=cls._native,
+                                                include_trace_on_error=include_trace_on_error)
+
   @contextmanager
   def graph_helper(self, build_file_aliases=None, build_file_imports_behavior='allow', include_trace_on_error=True):
     with temporary_dir() as work_dir:
-      path_ignore_patterns = ['.*']
-      graph_helper = EngineInitializer.setup_legacy_graph(path_ignore_patterns,
-                                                          work_dir,
-                                                          build_file_imports_behavior,
-                                                          build_file_aliases=build_file_aliases,
-                                                          native=self._native,
-                                                          include_trace_on_error=include_trace_on_error)
-      yield graph_helper
+      yield self._setup_legacy_graph(work_dir,
+                                     build_file_aliases=build_file_aliases,
+                                     build_file_imports_behavior=build_file_imports_behavior,
+                                     include_trace_on_error=include_trace_on_error)
 
   @contextmanager
   def open_scheduler(self, specs, build_file_aliases=None):
@@ -118,6 +126,32 @@ class GraphTargetScanFailureTests(GraphTestBase):
 
 class GraphInvalidationTest(GraphTestBase):
 
+  # NB: Engine startup dominates the cost of these tests, so tests using the default configuration
+  # share a single scheduler; each test requests its own specs and measures invalidation relative
+  # to the node counts it observes.
+  @classmethod
+  def setUpClass(cls):
+    super(GraphInvalidationTest, cls).setUpClass()
+    cls._shared_work_dir = safe_mkdtemp()
+    cls._shared_graph_helper = cls._setup_legacy_graph(cls._shared_work_dir)
+
+  @classmethod
+  def tearDownClass(cls):
+    cls._shared_graph_helper = None
+    safe_rmtree(cls._shared_work_dir)
+    super(GraphInvalidationTest, cls).tearDownClass()
+
+  @contextmanager
+  def graph_helper(self, build_file_aliases=None, build_file_imports_behavior='allow', include_trace_on_error=True):
+    if build_file_aliases is None and build_file_imports_behavior == 'allow' and include_trace_on_error:
+      yield self._shared_graph_helper
+    else:
+      with super(GraphInvalidationTest, self).graph_helper(
+          build_file_aliases=build_file_aliases,
+          build_file_imports_behavior=build_file_imports_behavior,
+          include_trace_on_error=include_trace_on_error) as graph_helper:
+        yield graph_helper
+
   def test_invalidate_fsnode(self):
     with self.open_scheduler(['3rdparty/python::']) as (_, _, scheduler):
       initial_node_count = scheduler.node_count()